@@ -161,7 +161,9 @@ def _edit(*, path: Path | None = None, text: str | None = None) -> str:
 
 def _format(props: Any, spec: str) -> str:
     """Formats an instance of a dataclass using the provided pattern"""
-    return spec.format(**dataclasses.asdict(props))
+    # Shallow field access, `dataclasses.asdict` would deep-copy each value.
+    fields = dataclasses.fields(props)
+    return spec.format(**{f.name: getattr(props, f.name) for f in fields})
 
 
 _PROMPT_PLACEHOLDER = "Enter your prompt here..."
@@ -11,7 +11,7 @@ from typing import Protocol
 from ..common import JSONObject, ensure_state_home, qualified_class_name
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Goal:
     """Bot request"""
 
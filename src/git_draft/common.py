@@ -35,7 +35,13 @@ def ensure_state_home() -> Path:
     return path
 
 
-@dataclasses.dataclass(frozen=True)
+def ensure_cache_home() -> Path:
+    path = xdg_base_dirs.xdg_cache_home() / PROGRAM
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Config:
     """Overall CLI configuration"""
 
@@ -62,7 +68,7 @@ class Config:
             return cls(**data)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class BotConfig:
     """Individual bot configuration for CLI use"""
 
@@ -37,7 +37,7 @@ from .worktrees import GitWorktree
 _logger = logging.getLogger(__name__)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Draft:
     """Generated changes"""
 
@@ -73,7 +73,7 @@ _FOLIO_UPSTREAM_BRANCH_SUFFIX = "+"
 _folio_branch_pattern = re.compile(_FOLIO_BRANCH_NAMESPACE + r"/(\d+)")
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Folio:
     """Collection of drafts"""
 
@@ -295,12 +295,14 @@ class Drafter:
             self._sync_head("finalize")
             self._repo.git("update-ref", _draft_ref(folio.id, "@"), "HEAD")
 
-            # Move back to the original branch, doing a little dance to keep
-            # the state. See https://stackoverflow.com/a/15993574 for the
-            # inspiration.
-            self._repo.git("checkout", "--detach")
-            self._repo.git("reset", "--soft", origin_branch)
-            self._repo.git("checkout", origin_branch)
+            # Move back to the original branch, keeping the index and working
+            # directory as-is. Pointing HEAD directly at the branch is
+            # equivalent to a detach, soft reset, and checkout but only
+            # requires a single git invocation. See
+            # https://stackoverflow.com/a/15993574 for the inspiration.
+            self._repo.git(
+                "symbolic-ref", "HEAD", f"refs/heads/{origin_branch}"
+            )
 
             # Clean up folio branches.
             self._repo.git(
@@ -476,7 +478,7 @@ class Drafter:
                 )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class DraftEventProperties:
     """Formattable properties corresponding to a draft's event"""
 
@@ -485,7 +487,7 @@ class DraftEventProperties:
     description: str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class _Change:
     """A bot-generated draft, may be a no-op"""
 
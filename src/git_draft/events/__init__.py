@@ -60,7 +60,9 @@ def event_decoders() -> Mapping[str, msgspec.json.Decoder]:
 class _Decoders(collections.defaultdict[str, msgspec.json.Decoder]):
     def __missing__(self, key: str) -> msgspec.json.Decoder:
         event_class = getattr(all_events, key)
-        return msgspec.json.Decoder(dec_hook=_dec_hook, type=event_class)
+        decoder = msgspec.json.Decoder(dec_hook=_dec_hook, type=event_class)
+        self[key] = decoder
+        return decoder
 
 
 def _dec_hook(tp: type, obj: Any) -> Any:
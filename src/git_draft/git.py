@@ -10,6 +10,7 @@ from pathlib import Path
 import subprocess
 from typing import Self
 import uuid
+import weakref
 
 
 _logger = logging.getLogger(__name__)
@@ -18,7 +19,7 @@ _logger = logging.getLogger(__name__)
 type SHA = str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class GitCall:
     """Git command execution result"""
 
@@ -81,6 +82,7 @@ class Repo:
 
     def __init__(self, working_dir: Path) -> None:
         self.working_dir = working_dir
+        self._blob_reader: _BlobReader | None = None
 
     @classmethod
     def enclosing(cls, path: Path) -> Self:
@@ -106,6 +108,18 @@ class Repo:
             working_dir=self.working_dir,
         )
 
+    def read_blob(self, rev: str) -> bytes | None:
+        """Returns the contents of a blob, or None if it doesn't exist
+
+        Reads are served by a single long-lived git process, started on first
+        use and stopped when this repo is garbage collected.
+        """
+        if "\n" in rev:  # Not representable in the batch protocol
+            return _read_blob_once(rev, self.working_dir)
+        if self._blob_reader is None:
+            self._blob_reader = _BlobReader(self.working_dir)
+        return self._blob_reader.read(rev)
+
     @property
     def uuid(self) -> uuid.UUID:
         value = _get_config_value(_ConfigKey.REPO_UUID, self.working_dir)
@@ -144,5 +158,54 @@ def _ensure_repo_uuid(working_dir: Path) -> None:
     _logger.debug("Set repo UUID. [uuid=%s]", repo_uuid)
 
 
+class _BlobReader:
+    """Persistent `git cat-file --batch` process"""
+
+    def __init__(self, working_dir: Path) -> None:
+        self._popen = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=working_dir,
+        )
+        weakref.finalize(self, _stop_process, self._popen)
+
+    def read(self, rev: str) -> bytes | None:
+        stdin, stdout = self._popen.stdin, self._popen.stdout
+        assert stdin and stdout
+        try:
+            stdin.write(f"{rev}\n".encode())
+            stdin.flush()
+        except BrokenPipeError as exc:
+            raise GitError("Blob reader exited unexpectedly") from exc
+        header = stdout.readline().decode("utf8")
+        if not header:
+            raise GitError("Blob reader exited unexpectedly")
+        if header.endswith((" missing\n", " ambiguous\n")):
+            return None
+        _sha, otype, size = header.split()
+        contents = stdout.read(int(size) + 1)[:-1]  # Trailing LF
+        return contents if otype == "blob" else None
+
+
+def _stop_process(popen: subprocess.Popen) -> None:
+    if popen.stdin:
+        popen.stdin.close()
+    popen.wait()
+    if popen.stdout:
+        popen.stdout.close()
+
+
+def _read_blob_once(rev: str, working_dir: Path) -> bytes | None:
+    completed = subprocess.run(
+        ["git", "cat-file", "blob", rev],
+        capture_output=True,
+        check=False,
+        cwd=working_dir,
+    )
+    return None if completed.returncode else completed.stdout
+
+
 def null_delimited(arg: str) -> Iterator[str]:
     return (item for item in arg.split("\x00") if item)
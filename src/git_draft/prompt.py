@@ -6,6 +6,7 @@ from collections.abc import Iterator, Mapping, Sequence
 import dataclasses
 import enum
 import functools
+import logging
 import os
 from pathlib import Path
 import re
@@ -15,17 +16,20 @@ import docopt
 import jinja2
 
 from .bots import Worktree
-from .common import Config, package_root
+from .common import Config, ensure_cache_home, package_root
 from .worktrees import EmptyWorktree
 
 
+_logger = logging.getLogger(__name__)
+
+
 _extension = "jinja"
 
 
 type PromptName = str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class TemplatedPrompt:
     """A parameterized prompt"""
 
@@ -50,13 +54,16 @@ def _check_public_template_name(name: str) -> None:
         raise ValueError(f"Invalid template name: {name}")
 
 
+@functools.cache
 def _jinja_environment(*, include_local: bool = True) -> jinja2.Environment:
+    # Shared so that compiled templates are reused across loads.
     folders = [_PromptFolder.BUILTIN]
     if include_local:
         folders.append(_PromptFolder.LOCAL)
     return jinja2.Environment(
         auto_reload=False,
         autoescape=False,
+        bytecode_cache=_bytecode_cache(),
         keep_trailing_newline=True,
         loader=jinja2.FileSystemLoader([f.path for f in folders]),
         trim_blocks=True,
@@ -65,6 +72,34 @@ def _jinja_environment(*, include_local: bool = True) -> jinja2.Environment:
     )
 
 
+def _bytecode_cache() -> jinja2.BytecodeCache | None:
+    # Compiled templates are also persisted across runs. Entries are keyed by
+    # a checksum of their source, so edited templates are recompiled.
+    try:
+        path = ensure_cache_home() / "templates"
+        path.mkdir(exist_ok=True)
+    except OSError as exc:
+        _logger.warning("Template cache unavailable. [error=%s]", exc)
+        return None
+    return _BytecodeCache(str(path))
+
+
+class _BytecodeCache(jinja2.FileSystemBytecodeCache):
+    """Best-effort bytecode cache, failures are logged and ignored"""
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except OSError as exc:
+            _logger.warning("Unable to load template cache. [error=%s]", exc)
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as exc:
+            _logger.warning("Unable to save template cache. [error=%s]", exc)
+
+
 class _PromptFolder(enum.Enum):
     BUILTIN = package_root
     LOCAL = Config.folder_path()
@@ -89,7 +124,7 @@ class _Context(TypedDict):
     worktree: Worktree
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class PromptMetadata:
     """Metadata about an available template"""
 
@@ -122,6 +157,8 @@ class PromptMetadata:
 class _Prompt:
     """Instantiated dynamic prompt"""
 
+    __slots__ = ("metadata",)
+
     def __init__(self, metadata: PromptMetadata) -> None:
         self.metadata = metadata
 
@@ -132,6 +169,8 @@ class _Prompt:
 class _StandalonePrompt(_Prompt):
     """Prompt without a layout"""
 
+    __slots__ = ("_rendered",)
+
     def __init__(self, metadata: PromptMetadata, rendered: str) -> None:
         super().__init__(metadata)
         self._rendered = rendered
@@ -145,6 +184,8 @@ class _StandalonePrompt(_Prompt):
 class _DocoptPrompt(_Prompt):
     """Prompt which supports options via docopt"""
 
+    __slots__ = ("_context", "_doc", "_template")
+
     def __init__(
         self,
         template: jinja2.Template,
@@ -185,8 +226,7 @@ def _load_prompt(
     env: jinja2.Environment, name: PromptName, worktree: Worktree
 ) -> _Prompt:
     rel_path = Path(f"{name}.{_extension}")
-    assert env.loader, "No loader in environment"
-    template = env.loader.load(env, str(rel_path))
+    template = env.get_template(str(rel_path))
     context: _Context = dict(
         program=name, prompt=_load_layouts(), worktree=worktree
     )
@@ -225,7 +265,7 @@ def list_templates(
         yield TemplateProperties(name, scope, metadata.description or "")
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class TemplateProperties:
     """Prompt template formattable properties"""
 
@@ -12,7 +12,7 @@ from typing import Self, override
 from .bots import Worktree
 from .common import UnreachableError
 from .events import Event, EventConsumer, worktree_events
-from .git import SHA, GitError, Repo, null_delimited
+from .git import SHA, Repo, null_delimited
 
 
 _logger = logging.getLogger(__name__)
@@ -71,15 +71,21 @@ class GitWorktree(Worktree):
     def __init__(
         self,
         repo: Repo,
-        start_rev: SHA,
+        tree_sha: SHA,
         event_consumer: EventConsumer | None = None,
     ) -> None:
-        call = repo.git("rev-parse", "--verify", f"{start_rev}^{{tree}}")
-        self._sha = call.stdout
+        self._sha = tree_sha
         self._updates = list[_Update]()
+        self._list_cache: tuple[SHA, Sequence[PurePosixPath]] | None = None
         self._repo = repo
         self._event_consumer = event_consumer
 
+    @classmethod
+    def for_rev(cls, repo: Repo, rev: str) -> Self:
+        """Returns a worktree starting from the given revision's tree"""
+        call = repo.git("rev-parse", "--verify", f"{rev}^{{tree}}")
+        return cls(repo, call.stdout)
+
     @classmethod
     def for_working_dir(cls, repo: Repo) -> tuple[Self, bool]:
         index_tree_sha = repo.git("write-tree").stdout
@@ -88,25 +94,34 @@ class GitWorktree(Worktree):
         head_tree_sha = repo.git("rev-parse", "HEAD^{tree}").stdout
         return tree, tree.sha() != head_tree_sha
 
-    def _sync_updates(self, *, worktree_path: Path | None = None) -> None:
-        repo = self._repo
-        if worktree_path:
-            repo = Repo(worktree_path)
-
+    def _sync_updates(self) -> None:
         def ls_files(*args: str) -> Iterator[str]:
-            return null_delimited(repo.git("ls-files", *args).stdout)
+            return null_delimited(self._repo.git("ls-files", *args).stdout)
 
         deleted = set[str]()
         for path_str in ls_files("-dz"):
             deleted.add(path_str)
             self._delete(PurePosixPath(path_str))
+
+        # Modified files are hashed with a single git call. Paths which can't
+        # be passed one per line are rare and hashed individually instead.
+        batched = list[str]()
         for path_str in ls_files("-moz", "--exclude-standard"):
             if path_str in deleted:
                 continue  # Deleted files also show up as modified
-            self._write_from_disk(
-                PurePosixPath(path_str),
-                worktree_path / path_str if worktree_path else Path(path_str),
+            if "\n" in path_str or path_str.startswith('"'):
+                self._write_from_disk(PurePosixPath(path_str), Path(path_str))
+            else:
+                batched.append(path_str)
+        if batched:
+            call = self._repo.git(
+                "hash-object", "-w", "--stdin-paths", stdin="\n".join(batched)
             )
+            blob_shas = call.stdout.split("\n")
+            for path_str, blob_sha in zip(batched, blob_shas, strict=True):
+                self._updates.append(
+                    _WriteBlob(PurePosixPath(path_str), blob_sha)
+                )
 
     def with_event_consumer(self, event_consumer: EventConsumer) -> Self:
         return self.__class__(self._repo, self.sha(), event_consumer)
@@ -175,17 +190,21 @@ class GitWorktree(Worktree):
         self._dispatch(worktree_events.StopEditingFiles())
 
     def _list(self) -> Sequence[PurePosixPath]:
-        call = self._repo.git("ls-tree", "-rz", "--name-only", self.sha())
-        return [PurePosixPath(p) for p in null_delimited(call.stdout)]
+        # Trees are immutable, so listings stay valid until the SHA changes.
+        sha = self.sha()
+        if self._list_cache is None or self._list_cache[0] != sha:
+            call = self._repo.git("ls-tree", "-rz", "--name-only", sha)
+            paths = tuple(
+                PurePosixPath(p) for p in null_delimited(call.stdout)
+            )
+            self._list_cache = (sha, paths)
+        return self._list_cache[1]
 
     def _read(self, path: PurePosixPath) -> str:
-        try:
-            return self._repo.git("show", f"{self.sha()}:{path}").stdout
-        except GitError as exc:
-            msg = str(exc)
-            if "does not exist in" in msg or "exists on disk, but not" in msg:
-                raise FileNotFoundError(f"{path} does not exist")
-            raise
+        contents = self._repo.read_blob(f"{self.sha()}:{path}")
+        if contents is None:
+            raise FileNotFoundError(f"{path} does not exist")
+        return contents.decode("utf8")
 
     def _write(self, path: PurePosixPath, contents: str) -> None:
         # Update the index without touching the worktree.
@@ -222,7 +241,11 @@ class GitWorktree(Worktree):
                 )
                 path = Path(path_str)
                 yield path
-                self._sync_updates(worktree_path=path)
+                # The temporary folder is a linked worktree with its own
+                # index, so the edited tree can be read back directly.
+                worktree_repo = Repo(path)
+                worktree_repo.git("add", "--all")
+                self._sha = worktree_repo.git("write-tree").stdout
             finally:
                 self._repo.git("worktree", "remove", "-f", path_str)
 
@@ -230,14 +253,16 @@ class GitWorktree(Worktree):
 class _Update:
     """Generic tree update"""
 
+    __slots__ = ()
+
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class _WriteBlob(_Update):
     path: PurePosixPath
     blob_sha: SHA
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class _DeleteBlob(_Update):
     path: PurePosixPath
 
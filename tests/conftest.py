@@ -0,0 +1,10 @@
+import os
+import tempfile
+
+
+def pytest_configure() -> None:
+    # Tests create many small files inside .git folders, which is noticeably
+    # faster on tmpfs. This also applies to pytest's own temporary paths.
+    path = os.environ.get("GIT_DRAFT_TEST_TMPDIR", "/dev/shm")
+    if os.path.isdir(path) and os.access(path, os.W_OK):
+        tempfile.tempdir = path
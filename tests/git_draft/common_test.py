@@ -1,41 +1,46 @@
 import logging
 from pathlib import Path
-import textwrap
 
 import pytest
 
 import git_draft.common as sut
 
 
+_CONFIG_TOML = """\
+log_level = "DEBUG"
+
+[[bots]]
+factory = "foo:load"
+pythonpath = "./abc"
+
+[[bots]]
+name = "bar"
+factory = "bar"
+options = {one=1}
+"""
+
+
 def test_ensure_state_home() -> None:
     path = sut.ensure_state_home()
     assert path.exists()
 
 
+def test_ensure_cache_home() -> None:
+    path = sut.ensure_cache_home()
+    assert path.exists()
+
+
 class TestConfig:
     @pytest.fixture(autouse=True)
     def config_home(self, monkeypatch, tmp_path) -> Path:
         path = tmp_path / "config"
-        monkeypatch.setattr(sut.xdg_base_dirs, "xdg_config_home", lambda: path)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(path))
         return path
 
     def test_load_ok(self) -> None:
-        text = """\
-            log_level = "DEBUG"
-
-            [[bots]]
-            factory = "foo:load"
-            pythonpath = "./abc"
-
-            [[bots]]
-            name = "bar"
-            factory = "bar"
-            options = {one=1}
-        """
         path = sut.Config.folder_path()
         path.mkdir(parents=True, exist_ok=True)
-        with open(path / "config.toml", "w") as f:
-            f.write(textwrap.dedent(text))
+        (path / "config.toml").write_text(_CONFIG_TOML)
 
         config = sut.Config.load()
         assert config == sut.Config(
@@ -1,26 +1,66 @@
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 import os
 from pathlib import Path
+import shutil
 
 import pytest
 
 from git_draft.git import GitCall, Repo
 
 
-@pytest.fixture
-def repo(tmp_path: Path) -> Iterator[Repo]:
-    path = tmp_path / "repo"
+@pytest.fixture(scope="session")
+def seed_repo_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Initialized repository, created once and copied by each test"""
+    path = tmp_path_factory.mktemp("seed") / "repo"
     path.mkdir()
     GitCall.sync("init", "-b", "main", working_dir=path)
-    repo = Repo.enclosing(path)
+    repo = Repo.enclosing(path)  # Also sets the repo's UUID
     repo.git("commit", "-m", "init", "--allow-empty")
-    yield repo
+    return path
+
+
+_objects_folder = os.path.join(".git", "objects", "")
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    # Git never modifies object files once written, so copies of the seed can
+    # share them. Everything else (index, refs, config) is copied since tests
+    # mutate it.
+    if _objects_folder in src:
+        try:
+            os.link(src, dst)
+        except OSError:
+            pass
+        else:
+            return
+    shutil.copy2(src, dst)
 
 
-@pytest.fixture(autouse=True)
-def state_home(monkeypatch, tmp_path) -> None:
-    path = tmp_path / "state"
-    monkeypatch.setenv("XDG_STATE_HOME", str(path))
+@pytest.fixture
+def repo(seed_repo_path: Path, tmp_path: Path) -> Iterator[Repo]:
+    path = tmp_path / "repo"
+    shutil.copytree(
+        seed_repo_path, path, symlinks=True, copy_function=_link_or_copy
+    )
+    # The seed is already a top-level folder with its UUID set, so we can skip
+    # the git calls performed by `Repo.enclosing`.
+    yield Repo(path)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def state_home(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    path = tmp_path_factory.getbasetemp() / "state"
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_STATE_HOME", str(path))
+        yield path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_home(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    path = tmp_path_factory.getbasetemp() / "cache"
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(path))
+        yield path
 
 
 class RepoFS:
@@ -32,16 +72,21 @@ class RepoFS:
 
     def read(self, name: str) -> str | None:
         try:
-            with open(self.path(name)) as f:
-                return f.read()
+            return self.path(name).read_text()
         except FileNotFoundError:
             return None
 
     def write(self, name: str, contents="") -> None:
         path = self.path(name)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            f.write(contents)
+        path.write_text(contents)
+
+    def write_many(self, files: Mapping[str, str]) -> None:
+        paths = {name: self.path(name) for name in files}
+        for parent in {p.parent for p in paths.values()}:
+            parent.mkdir(parents=True, exist_ok=True)
+        for name, path in paths.items():
+            path.write_text(files[name])
 
     def delete(self, name: str) -> None:
         os.remove(self.path(name))
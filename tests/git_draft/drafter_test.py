@@ -1,12 +1,13 @@
-from collections.abc import Callable, Mapping, Sequence
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
 from pathlib import PurePosixPath
-from typing import Self
 
 import pytest
 
 from git_draft.bots import ActionSummary, Bot, Goal, UserFeedback, Worktree
 import git_draft.drafter as sut
-from git_draft.git import SHA, GitError, Repo
+from git_draft.git import GitError, Repo
 from git_draft.progress import Progress
 from git_draft.store import Store
 
@@ -19,21 +20,20 @@ class _SimpleBot(Bot):
     def __init__(
         self, contents: Mapping[str, str | None | Callable[[Goal], str]]
     ) -> None:
-        self._contents = contents
+        self._contents = {PurePosixPath(k): v for k, v in contents.items()}
 
-    @classmethod
-    def noop(cls) -> Self:
-        return cls({})
+    @staticmethod
+    def noop() -> _SimpleBot:
+        return _NOOP_BOT
 
-    @classmethod
-    def prompt(cls) -> Self:
-        return cls({"PROMPT": lambda goal: goal.prompt})
+    @staticmethod
+    def prompt() -> _SimpleBot:
+        return _PROMPT_BOT
 
     async def act(
         self, goal: Goal, tree: Worktree, _feedback: UserFeedback
     ) -> ActionSummary:
-        for key, value in self._contents.items():
-            path = PurePosixPath(key)
+        for path, value in self._contents.items():
             if value is None:
                 tree.delete_file(path)
             else:
@@ -42,6 +42,15 @@ class _SimpleBot(Bot):
         return ActionSummary()
 
 
+def _goal_prompt(goal: Goal) -> str:
+    return goal.prompt
+
+
+# The bot is stateless, so common instances are shared across tests.
+_NOOP_BOT = _SimpleBot({})
+_PROMPT_BOT = _SimpleBot({"PROMPT": _goal_prompt})
+
+
 class TestDrafter:
     @pytest.fixture(autouse=True)
     def setup(self, repo: Repo, repo_fs: RepoFS) -> None:
@@ -51,15 +60,9 @@ class TestDrafter:
             repo, Store.in_memory(), Progress.static()
         )
 
-    def _commits(self, ref: str | None = None) -> Sequence[SHA]:
-        git = self._repo.git("log", "--pretty=format:%H", ref or "HEAD")
-        return git.stdout.splitlines()
-
-    def _commit_files(self, ref: str) -> frozenset[str]:
-        git = self._repo.git(
-            "diff-tree", ref, "--no-commit-id", "--name-only", "--relative"
-        )
-        return frozenset(git.stdout.splitlines())
+    def _commit_count(self, ref: str | None = None) -> int:
+        git = self._repo.git("rev-list", "--count", ref or "HEAD")
+        return int(git.stdout)
 
     def _checkout(self) -> None:
         self._repo.git("checkout", "--", ".")
@@ -68,15 +71,15 @@ class TestDrafter:
     async def test_generate_draft(self) -> None:
         self._fs.write("p1", "a")
         await self._drafter.generate_draft("hello", _SimpleBot({"p1": "A"}))
-        assert len(self._commits()) == 1
-        assert len(self._commits("@{u}")) == 3
+        assert self._commit_count() == 1
+        assert self._commit_count("@{u}") == 3
         assert self._fs.read("p1") == "a"
 
     @pytest.mark.asyncio
     async def test_generate_empty_draft(self) -> None:
         await self._drafter.generate_draft("hello", _SimpleBot.noop())
-        assert len(self._commits()) == 1
-        assert len(self._commits("@{u}")) == 2
+        assert self._commit_count() == 1
+        assert self._commit_count("@{u}") == 2
 
     @pytest.mark.asyncio
     async def test_generate_draft_merge(self) -> None:
@@ -88,7 +91,7 @@ class TestDrafter:
             merge_strategy="ignore-all-space",
         )
         # No sync(merge) commit since no changes happened between.
-        assert len(self._commits()) == 4  # init, sync(prompt), prompt, merge
+        assert self._commit_count() == 4  # init, sync(prompt), prompt, merge
         assert self._fs.read("p1") == "a"
         assert self._fs.read("a/p2") == "b"
 
@@ -105,7 +108,7 @@ class TestDrafter:
             _SimpleBot({"p1": update}),
             merge_strategy="ignore-all-space",
         )
-        assert len(self._commits()) == 5  # init, sync, prompt, sync, merge
+        assert self._commit_count() == 5  # init, sync, prompt, sync, merge
         assert self._fs.read("p1") == "A"
         assert self._fs.read("p2") == "b"
 
@@ -121,7 +124,7 @@ class TestDrafter:
             "hello", _SimpleBot({"p1": update}), merge_strategy="theirs"
         )
         # sync(merge) commit here since p1 was updated separately.
-        assert len(self._commits()) == 5  # init, sync, prompt, sync, merge
+        assert self._commit_count() == 5  # init, sync, prompt, sync, merge
         assert self._fs.read("p1") == "A"
 
     @pytest.mark.asyncio
@@ -152,7 +155,7 @@ class TestDrafter:
 
     @pytest.mark.asyncio
     async def test_generate_reuse_branch(self) -> None:
-        bot = _SimpleBot({"prompt": lambda goal: goal.prompt})
+        bot = _SimpleBot({"prompt": _goal_prompt})
         await self._drafter.generate_draft("prompt1", bot, "theirs")
         await self._drafter.generate_draft("prompt2", bot, "theirs")
         assert self._fs.read("prompt") == "prompt2"
@@ -169,6 +172,7 @@ class TestDrafter:
         )
         self._fs.write("p1.txt", "a2")
         self._drafter.quit_folio()
+        assert self._repo.active_branch() == "main"
         assert self._fs.read("p1.txt") == "a2"
         assert self._fs.read("PROMPT") == "hello"
 
@@ -190,7 +194,7 @@ class TestDrafter:
 
     @pytest.mark.asyncio
     async def test_list_draft_events(self) -> None:
-        bot = _SimpleBot({"prompt": lambda goal: goal.prompt})
+        bot = _SimpleBot({"prompt": _goal_prompt})
         await self._drafter.generate_draft("prompt1", bot, "theirs")
         lines = list(self._drafter.list_draft_events())
         assert len(lines) == 1
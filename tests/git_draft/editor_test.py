@@ -1,75 +1,70 @@
 import shutil
 import subprocess
+from unittest.mock import patch
 
 import pytest
 
 import git_draft.editor as sut
 
 
+class _Popen:
+    def __init__(self, *_args, **_kwargs):
+        pass
+
+    def communicate(self):
+        pass
+
+
 class TestGuessEditorBinPath:
     def test_from_env_ok(self, monkeypatch) -> None:
         def which(editor):
             assert editor == "foo"
             return "/bin/bar"
 
-        monkeypatch.setattr(shutil, "which", which)
         monkeypatch.setenv("EDITOR", "foo")
 
-        assert sut._guess_editor_binpath() == "/bin/bar"
+        with patch.object(shutil, "which", side_effect=which):
+            assert sut._guess_editor_binpath() == "/bin/bar"
 
     def test_from_env_missing(self, monkeypatch) -> None:
-        def which(_editor):
-            return ""
-
-        monkeypatch.setattr(shutil, "which", which)
         monkeypatch.setenv("EDITOR", "foo")
 
-        assert sut._guess_editor_binpath() == ""
+        with patch.object(shutil, "which", return_value=""):
+            assert sut._guess_editor_binpath() == ""
 
     def test_from_default_ok(self, monkeypatch) -> None:
         def which(editor):
             return "/bin/nano" if editor == "nano" else ""
 
-        monkeypatch.setattr(shutil, "which", which)
         monkeypatch.setenv("EDITOR", "")
 
-        assert sut._guess_editor_binpath() == "/bin/nano"
+        with patch.object(shutil, "which", side_effect=which):
+            assert sut._guess_editor_binpath() == "/bin/nano"
 
     def test_from_default_missing(self, monkeypatch) -> None:
-        def which(_editor):
-            return ""
-
-        monkeypatch.setattr(shutil, "which", which)
         monkeypatch.setenv("EDITOR", "")
 
-        assert sut._guess_editor_binpath() == ""
+        with patch.object(shutil, "which", return_value=""):
+            assert sut._guess_editor_binpath() == ""
 
 
 class TestOpenEditor:
-    def test_no_binpath(self, monkeypatch) -> None:
-        def which(_editor):
-            return ""
-
-        monkeypatch.setattr(shutil, "which", which)
-
-        with pytest.raises(ValueError):
+    def test_no_binpath(self) -> None:
+        with (
+            patch.object(shutil, "which", return_value=""),
+            pytest.raises(ValueError),
+        ):
             sut.open_editor()
 
-    def test_ok(self, monkeypatch) -> None:
+    def test_ok(self) -> None:
         def which(editor):
             return f"/bin/{editor}"
 
         def open_tty(*_args):
             return None
 
-        class Popen:
-            def __init__(self, *_args, **_kwargs):
-                pass
-
-            def communicate(self):
-                pass
-
-        monkeypatch.setattr(shutil, "which", which)
-        monkeypatch.setattr(subprocess, "Popen", Popen)
-
-        assert sut.open_editor("hello", _open_tty=open_tty) == "hello"
+        with (
+            patch.object(shutil, "which", side_effect=which),
+            patch.object(subprocess, "Popen", _Popen),
+        ):
+            assert sut.open_editor("hello", _open_tty=open_tty) == "hello"
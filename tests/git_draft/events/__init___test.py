@@ -7,7 +7,7 @@ import git_draft.events as sut
 
 
 class TestEventEncoder:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def encoder(self):
         return sut.event_encoder()
 
@@ -19,7 +19,7 @@ class TestEventEncoder:
 
 
 class TestEventDecoders:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def decoders(self):
         return sut.event_decoders()
 
@@ -30,6 +30,9 @@ class TestEventDecoders:
         assert isinstance(event, sut.worktree_events.DeleteFile)
         assert event.path == PurePosixPath(path_str)
 
+    def test_decoder_is_reused(self, decoders):
+        assert decoders["DeleteFile"] is decoders["DeleteFile"]
+
     def test_decoder_for_unknown_event_raises_keyerror(self, decoders):
         with pytest.raises(AttributeError):
             _ = decoders["NonExistentEvent"]
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from git_draft.git import GitCall, Repo
+
+from .conftest import RepoFS
+
+
+class TestRepo:
+    def test_active_branch(self, repo: Repo) -> None:
+        assert repo.active_branch() == "main"
+        repo.git("checkout", "-b", "draft/1")
+        assert repo.active_branch() == "draft/1"
+
+    def test_active_branch_detached(self, repo: Repo) -> None:
+        repo.git("checkout", "--detach")
+        assert repo.active_branch() is None
+
+    def test_active_branch_linked_worktree(
+        self, repo: Repo, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "linked"
+        repo.git("worktree", "add", "-b", "other", str(path))
+        assert Repo(path).active_branch() == "other"
+
+    def test_active_branch_reftable(self, tmp_path: Path) -> None:
+        # With reftable storage, .git/HEAD is a stub which doesn't name the
+        # actual branch.
+        path = tmp_path / "reftable"
+        call = GitCall.sync(
+            "init",
+            "--ref-format=reftable",
+            "-b",
+            "trunk",
+            str(path),
+            expect_codes=(),
+        )
+        if call.code:
+            pytest.skip("Reftable storage not supported")
+        assert Repo(path).active_branch() == "trunk"
+
+    def test_read_blob(self, repo: Repo, repo_fs: RepoFS) -> None:
+        repo_fs.write_many({"f1": "a\n\n", "d1/f2": "b", "n\nl": "c"})
+        sha = repo_fs.flush()
+        assert repo.read_blob(f"{sha}:f1") == b"a\n\n"
+        assert repo.read_blob(f"{sha}:d1/f2") == b"b"
+        assert repo.read_blob(f"{sha}:n\nl") == b"c"
+        assert repo.read_blob(f"{sha}:d1") is None
+        assert repo.read_blob(f"{sha}:f3") is None
@@ -1,3 +1,8 @@
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import jinja2
 import pytest
 
 import git_draft.prompt as sut
@@ -15,10 +20,48 @@ class TestCheckPublicTemplateName:
             sut._check_public_template_name(name)
 
 
+def test_jinja_environment_is_shared() -> None:
+    assert sut._jinja_environment() is sut._jinja_environment()
+
+
+class TestBytecodeCache:
+    @pytest.fixture(autouse=True)
+    def setup(self, repo, monkeypatch, tmp_path: Path) -> Iterator[None]:
+        self._tree = GitWorktree.for_rev(repo, "HEAD")
+        self._cache_home = tmp_path / "cache"
+        monkeypatch.setenv("XDG_CACHE_HOME", str(self._cache_home))
+        sut._jinja_environment.cache_clear()
+        yield
+        sut._jinja_environment.cache_clear()
+
+    def _render(self) -> None:
+        prompt = sut.TemplatedPrompt("add-test", ("--symbol=foo",))
+        assert "foo" in prompt.render(self._tree)
+        assert list(sut.list_templates())
+
+    def test_writes_files(self) -> None:
+        self._render()
+        path = self._cache_home / "git-draft" / "templates"
+        assert any(p.suffix == ".cache" for p in path.iterdir())
+
+    def test_unusable_folder(self) -> None:
+        self._cache_home.write_text("")  # Not a folder
+        self._render()
+        assert not sut._jinja_environment().bytecode_cache
+
+    def test_failed_dump(self) -> None:
+        with patch.object(
+            jinja2.FileSystemBytecodeCache,
+            "dump_bytecode",
+            side_effect=PermissionError("read-only"),
+        ):
+            self._render()
+
+
 class TestTemplatedPrompt:
     @pytest.fixture(autouse=True)
     def setup(self, repo) -> None:
-        self._tree = GitWorktree(repo, "HEAD")
+        self._tree = GitWorktree.for_rev(repo, "HEAD")
 
     def test_ok(self) -> None:
         prompt = sut.TemplatedPrompt("add-test", ("--symbol=foo",))
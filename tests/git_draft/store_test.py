@@ -5,7 +5,7 @@ import git_draft.store as sut
 
 class TestStore:
     def test_cursor(self) -> None:
-        store = sut.Store.persistent()
+        store = sut.Store.in_memory()
         with store.cursor() as cursor:
             cursor.execute("create table foo(id int)")
             cursor.execute("insert into foo values (1), (2)")
@@ -13,6 +13,12 @@ class TestStore:
             data = cursor.execute("select * from foo")
             assert list(data) == [(1,), (2,)]
 
+    def test_persistent(self) -> None:
+        store = sut.Store.persistent()
+        with store.cursor() as cursor:
+            data = cursor.execute("select 1")
+            assert list(data) == [(1,)]
+
 
 class TestSQL:
     def test_ok(self) -> None:
@@ -18,15 +18,26 @@ class TestRepoWorktree:
         self._fs = repo_fs
 
     def test_list_files(self) -> None:
-        self._fs.write("f1", "a")
-        self._fs.write("f2", "b")
+        self._fs.write_many({"f1": "a", "f2": "b"})
         self._fs.flush()
 
-        tree = sut.GitWorktree(self._repo, "HEAD")
+        tree = sut.GitWorktree.for_rev(self._repo, "HEAD")
         self._fs.delete("f2")
         self._fs.write("f3", "c")
         assert set(str(p) for p in tree.list_files()) == {"f1", "f2"}
 
+    def test_list_files_after_update(self) -> None:
+        self._fs.write("f1", "a")
+        self._fs.flush()
+
+        tree = sut.GitWorktree.for_rev(self._repo, "HEAD")
+        assert tree.list_files() == (PPP("f1"),)
+        assert tree.list_files() is tree.list_files()
+        tree.write_file(PPP("f2"), "b")
+        assert tree.list_files() == (PPP("f1"), PPP("f2"))
+        tree.delete_file(PPP("f1"))
+        assert tree.list_files() == (PPP("f2"),)
+
     def test_read_file(self) -> None:
         self._fs.write("f1", "a")
         sha = self._fs.flush()
@@ -34,19 +45,18 @@ class TestRepoWorktree:
         self._fs.flush()
         self._fs.write("f2", "b")
 
-        tree = sut.GitWorktree(self._repo, sha)
+        tree = sut.GitWorktree.for_rev(self._repo, sha)
         assert tree.read_file(PPP("f1")) == "a"
         assert tree.read_file(PPP("f2")) is None
         assert tree.read_file(PPP("f3")) is None
 
     def test_write_file(self) -> None:
-        self._fs.write("f1", "a")
-        self._fs.write("f2", "b")
+        self._fs.write_many({"f1": "a", "f2": "b"})
         sha = self._fs.flush()
         self._fs.write("f1", "aa")
         self._fs.flush()
 
-        tree = sut.GitWorktree(self._repo, sha)
+        tree = sut.GitWorktree.for_rev(self._repo, sha)
         tree.write_file(PPP("f1"), "aaa")
         tree.write_file(PPP("f3"), "c")
         assert tree.read_file(PPP("f1")) == "aaa"
@@ -58,7 +68,7 @@ class TestRepoWorktree:
         self._fs.write("d1/f1", "a")
         sha = self._fs.flush()
 
-        tree = sut.GitWorktree(self._repo, sha)
+        tree = sut.GitWorktree.for_rev(self._repo, sha)
         tree.write_file(PPP("d1/f2"), "b")  # In existing directory
         tree.write_file(PPP("d1/d2/f3"), "c")  # In new directory
         tree.write_file(PPP("d1/d2/d3/f4"), "d")  # In new directory
@@ -70,15 +80,13 @@ class TestRepoWorktree:
         self._fs.write("f1", "a")
         sha = self._fs.flush()
 
-        tree = sut.GitWorktree(self._repo, sha)
+        tree = sut.GitWorktree.for_rev(self._repo, sha)
         tree.write_file(PPP("f1/f2"), "b")
         with pytest.raises(RuntimeError):
             _ = tree.sha()
 
     def test_for_working_dir_dirty(self) -> None:
-        self._fs.write("f1", "a")
-        self._fs.write("f2", "b")
-        self._fs.write("f3", "c")
+        self._fs.write_many({"f1": "a", "f2": "b", "f3": "c"})
         self._fs.flush()
         self._fs.write("f1", "aa")
         self._fs.delete("f2")
@@ -89,20 +97,28 @@ class TestRepoWorktree:
         assert tree.read_file(PPP("f2")) is None
         assert tree.read_file(PPP("f3")) == "c"
 
-    def test_edit_files(self) -> None:
+    def test_for_working_dir_unusual_names(self) -> None:
         self._fs.write("f1", "a")
-        self._fs.write("f2", "b")
         self._fs.flush()
-        tree = sut.GitWorktree(self._repo, "HEAD")
+        files = {"f1": "aa", "d1/f2": "b", '"q': "c", "n\nl": "d"}
+        self._fs.write_many(files)
+
+        tree, dirty = sut.GitWorktree.for_working_dir(self._repo)
+        assert dirty
+        for name, contents in files.items():
+            assert tree.read_file(PPP(name)) == contents
+
+    def test_edit_files(self) -> None:
+        self._fs.write_many({"f1": "a", "f2": "b"})
+        self._fs.flush()
+        tree = sut.GitWorktree.for_rev(self._repo, "HEAD")
         tree.delete_file(PPP("f1"))
         tree.write_file(PPP("f3"), "c")
 
         with tree.edit_files() as path:
             assert {".git", "f2", "f3"} == set(c.name for c in path.iterdir())
-            with open(path / "f2", "w") as w:
-                w.write("bb")
-            with open(path / "f4", "w") as w:
-                w.write("d")
+            (path / "f2").write_text("bb")
+            (path / "f4").write_text("d")
             (path / "f3").unlink()
 
             # Before sync, tree does not have changes.
@@ -113,3 +129,15 @@ class TestRepoWorktree:
         assert tree.read_file(PPP("f2")) == "bb"
         assert tree.read_file(PPP("f3")) is None
         assert tree.read_file(PPP("f4")) == "d"
+
+    def test_edit_files_many(self) -> None:
+        tree = sut.GitWorktree.for_rev(self._repo, "HEAD")
+
+        names = [f"d{i % 3}/f{i}" for i in range(20)] + ['"q', "n\nl"]
+        with tree.edit_files() as path:
+            for name in names:
+                (path / name).parent.mkdir(exist_ok=True)
+                (path / name).write_text(name)
+
+        for name in names:
+            assert tree.read_file(PPP(name)) == name